@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import gzip
 import json
 from typing import Any
-from urllib.request import urlopen  # stdlib to keep this simple
+from urllib.request import Request, urlopen  # stdlib to keep this simple
 
 
 def fetch_public_json(url: str, timeout: int = 20) -> list[dict[str, Any]]:
     """Tiny helper for optional public JSON fallback."""
-    with urlopen(url, timeout=timeout) as r:  # nosec - used for read-only public JSON
-        payload = json.loads(r.read().decode("utf-8"))
+    # urllib never asks for compression by itself, and repetitive JSON compresses well
+    req = Request(url, headers={"Accept-Encoding": "gzip"})
+    with urlopen(req, timeout=timeout) as r:  # nosec - used for read-only public JSON
+        body = r.read()
+        if r.headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+    payload = json.loads(body)
     if isinstance(payload, list):
         return payload  # type: ignore[return-value]
     return []  # conservative
@@ -8,20 +8,34 @@ Primary JSON endpoint (documented by Microsoft release comms):
 
 Behavior:
 - Try JSON first (fast and structured).
-- If JSON fails, fall back to parsing XML using lxml/bs4.
+- If JSON fails, fall back to stream-parsing the XML with lxml iterparse.
 - Filter by feature IDs and shape rows to TABLE_HEADERS.
 
 Exported:
-    fetch_ids_rss(id_list: list[str]) -> list[list[str]]
+    fetch_ids_rss(id_list: list[str], cache_dir=None) -> list[list[str]]
+    cached_get(url, accept, cache_dir, session=None) -> Path   (also used by fetch_ids)
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, cast
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: C-level JSON decode, stdlib json otherwise
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 TABLE_HEADERS = [
     "ID",
@@ -37,6 +51,26 @@ TABLE_HEADERS = [
 
 FEED_URL = "https://www.microsoft.com/releasecommunications/api/v2/m365/rss"
 
+# One keep-alive pool for every feed request (JSON, XML fallback, revalidation).
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "m365-roadmap-fetch/1.0"  # requests already sends gzip
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)),
+    ),
+)
+
+_RE_FEATURE_ID = re.compile(r"featureid=(\d+)", re.I)
+_RE_TARGETED = re.compile(r"([A-Z][a-z]+ CY20\d{2})")
+_STATUS_HINTS = ("In development", "Rolling out", "Launched", "Cancelled", "Archived")
+_PHASE_HINTS = ("General Availability", "Preview", "Targeted Release")
+# (label, lowered label) pairs so the per-item scan never re-lowers the hints
+_STATUS_HINTS_LOW = tuple((h, h.lower()) for h in _STATUS_HINTS)
+_PHASE_HINTS_LOW = tuple((h, h.lower()) for h in _PHASE_HINTS)
+
 
 def _clean(s: str | None) -> str:
     if not s:
@@ -52,19 +86,23 @@ def _split_title_product(title: str) -> tuple[str, str]:
 
 
 def _extract_feature_id(url_or_text: str) -> str:
-    m = re.search(r"featureid=(\d+)", url_or_text, flags=re.I)
+    m = _RE_FEATURE_ID.search(url_or_text)
     return m.group(1) if m else ""
 
 
-def _row_from_item(item: dict) -> list[str]:
+def _row_from_item(item: dict, want: set[str] | None = None) -> list[str] | None:
     """
     Build a row from a JSON feed item (best-effort mapping).
     We expect keys like: title, link, description, categories, etc.
+    When ``want`` is given, items whose feature ID is not in it return None
+    before any of the hint scanning below is done.
     """
     link = _clean(item.get("link") or item.get("url") or "")
     title = _clean(item.get("title") or "")
     desc = _clean(item.get("description") or item.get("summary") or "")
     fid = _extract_feature_id(link) or _extract_feature_id(title) or _extract_feature_id(desc)
+    if want is not None and fid not in want:
+        return None
 
     # Try to infer fields from categories/tags or text hints
     cats = item.get("categories") or item.get("tags") or []
@@ -80,18 +118,19 @@ def _row_from_item(item: dict) -> list[str]:
 
     # Try to detect status/phase hints
     hay = " ".join(categories + [title, desc])
+    hay_low = hay.lower()
     # Simple status hints
-    for candidate in ["In development", "Rolling out", "Launched", "Cancelled", "Archived"]:
-        if candidate.lower() in hay.lower():
+    for candidate, low in _STATUS_HINTS_LOW:
+        if low in hay_low:
             status = candidate
             break
     # Simple phase hints
-    for candidate in ["General Availability", "Preview", "Targeted Release"]:
-        if candidate.lower() in hay.lower():
+    for candidate, low in _PHASE_HINTS_LOW:
+        if low in hay_low:
             phase = candidate
             break
     # Targeted dates hints (e.g., 'September CY2025')
-    m = re.search(r"([A-Z][a-z]+ CY20\d{2})", hay)
+    m = _RE_TARGETED.search(hay)
     if m:
         targeted = m.group(1)
 
@@ -110,35 +149,120 @@ def _row_from_item(item: dict) -> list[str]:
     ]
 
 
-def _fetch_json() -> list[dict]:
-    r = requests.get(FEED_URL, headers={"Accept": "application/json"}, timeout=60)
-    r.raise_for_status()
-    # Some servers return text with JSON content-type; json.loads handles both
-    return json.loads(r.text)
+_JSON_ACCEPT = "application/json"
+_XML_ACCEPT = "application/rss+xml, application/xml, */*"
 
 
-def _fetch_xml_items() -> list[dict]:
-    r = requests.get(
-        FEED_URL, headers={"Accept": "application/rss+xml, application/xml, */*"}, timeout=60
-    )
-    r.raise_for_status()
-    soup = BeautifulSoup(r.text, "xml")
+@contextmanager
+def _staged(path: Path) -> Iterator[BinaryIO]:
+    """Write a per-writer temp file beside ``path``; os.replace() it in, or unlink on error.
+
+    Concurrent runs sharing a cache_dir never swap in each other's partial file, and a
+    failed download leaves nothing behind.
+    """
+    tmp = path.with_name(f"{path.name}.{os.urandom(4).hex()}.tmp")
+    f = tmp.open("xb")  # noqa: SIM115 -- outside the try: a name clash is not ours to unlink
+    try:
+        with f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def cached_get(url: str, accept: str, cache_dir: str | Path, session: Any = None) -> Path:
+    """
+    Conditional GET into ``cache_dir`` and return the path of the current body.
+    The stored ETag / Last-Modified are replayed; on 304 the cached body is reused,
+    otherwise the new body and then its validators are streamed to disk and swapped in
+    atomically. ``session`` defaults to this module's pooled session.
+    """
+    d = Path(cache_dir)
+    d.mkdir(parents=True, exist_ok=True)
+    key = hashlib.sha256(f"{url}|{accept}".encode()).hexdigest()[:16]
+    body, meta = d / f"{key}.body", d / f"{key}.meta.json"
+
+    headers = {"Accept": accept}
+    if body.exists() and meta.exists():
+        try:
+            validators = json.loads(meta.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            validators = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    with (session or _SESSION).get(url, headers=headers, timeout=60, stream=True) as r:
+        if r.status_code == 304:
+            return body
+        r.raise_for_status()
+        with _staged(body) as f:
+            for chunk in r.iter_content(chunk_size=1 << 16):
+                f.write(chunk)
+        # validators last: a crash before this leaves old ones, which just miss next time
+        validators = {
+            "etag": r.headers.get("ETag", ""),
+            "last_modified": r.headers.get("Last-Modified", ""),
+        }
+        with _staged(meta) as f:
+            f.write(json.dumps(validators).encode("utf-8"))
+    return body
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or text; orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fetch_json(cache_dir: str | Path | None = None) -> list[dict]:
+    if cache_dir:
+        body = cached_get(FEED_URL, _JSON_ACCEPT, cache_dir).read_bytes()
+    else:
+        r = _SESSION.get(FEED_URL, headers={"Accept": _JSON_ACCEPT}, timeout=60)
+        r.raise_for_status()
+        body = r.content  # raw bytes: skips requests' charset sniffing and str decode
+    return cast(list[dict], _json_loads(body))
+
+
+def _parse_xml_items(source: Any) -> list[dict]:
+    """Stream <item> elements from a file-like source; each is freed once read."""
     items = []
-    for it in soup.find_all("item"):
+    # recover=True: tolerate feed glitches such as a bare "&" rather than losing the fallback
+    for _event, el in etree.iterparse(source, events=("end",), tag="item", recover=True):
         items.append(
             {
-                "title": it.title.text if it.title else "",
-                "link": it.link.text if it.link else "",
-                "description": it.description.text if it.description else "",
-                "categories": [c.text for c in it.find_all("category")],
+                "title": el.findtext("title") or "",
+                "link": el.findtext("link") or "",
+                "description": el.findtext("description") or "",
+                "categories": [c.text or "" for c in el.iterfind("category")],
             }
         )
+        # standard lxml streaming idiom: drop the element and its already-read siblings
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
     return items
 
 
-def fetch_ids_rss(id_list: list[str]) -> list[list[str]]:
+def _fetch_xml_items(cache_dir: str | Path | None = None) -> list[dict]:
+    if cache_dir:
+        with cached_get(FEED_URL, _XML_ACCEPT, cache_dir).open("rb") as f:
+            return _parse_xml_items(f)
+    with _SESSION.get(FEED_URL, headers={"Accept": _XML_ACCEPT}, timeout=60, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True  # let urllib3 undo gzip/deflate for the parser
+        return _parse_xml_items(r.raw)
+
+
+def fetch_ids_rss(id_list: list[str], cache_dir: str | Path | None = None) -> list[list[str]]:
     """
     Download the programmatic feed (JSON first, then XML) and filter by IDs.
+    With ``cache_dir``, responses are revalidated via ETag / If-Modified-Since and an
+    unchanged feed is read back from disk instead of being downloaded again.
     """
     want = {str(i).strip() for i in id_list if str(i).strip()}
     if not want:
@@ -149,7 +273,7 @@ def fetch_ids_rss(id_list: list[str]) -> list[list[str]]:
 
     # Try JSON first
     try:
-        items = _fetch_json()
+        items = _fetch_json(cache_dir)
         # Some variants wrap in {'items': [...]}
         if isinstance(items, dict) and "items" in items:
             items = items["items"]
@@ -158,12 +282,11 @@ def fetch_ids_rss(id_list: list[str]) -> list[list[str]]:
             raise ValueError("Unexpected JSON shape")
     except Exception:
         # Fallback to XML parse
-        items = _fetch_xml_items()
+        items = _fetch_xml_items(cache_dir)
 
     for it in items:
-        row = _row_from_item(it)
-        fid = row[0]
-        if fid and fid in want:
+        row = _row_from_item(it, want)
+        if row is not None:
             rows.append(row)
 
     return rows
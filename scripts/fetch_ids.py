@@ -21,19 +21,35 @@ Features
   --out PATH               when --emit csv, write UTF-8 CSV here
   --max-items INT          cap items (0 = no cap)
   --max-pages INT          accepted for backward-compat, ignored
+  --cache-dir PATH         keep the API response here; re-runs send If-None-Match and
+                           reuse it on 304 Not Modified
   --debug                  print diagnostics to stderr
 """
 
 import argparse
 import csv
+import json
 import re
 import sys
-from datetime import datetime, timedelta
+from datetime import UTC, datetime
+from typing import Any
 
 import requests
+from dateutil.relativedelta import relativedelta
+
+try:
+    import orjson  # optional: C-level JSON decode, stdlib json otherwise
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 API = "https://www.microsoft.com/releasecommunications/api/v1/m365"
 
+# Fuzzy roadmap dates ('Q3 CY2025', 'H1 2025', '2025'); compiled once, used per item
+RE_CY = re.compile(r"\bCY\s*", re.IGNORECASE)
+RE_QUARTER = re.compile(r"^Q([1-4])\s+(\d{4})$", re.IGNORECASE)
+RE_HALF = re.compile(r"^H([12])\s+(\d{4})$", re.IGNORECASE)
+RE_YEAR = re.compile(r"^(\d{4})$")
+
 # ---------- stdout: force UTF-8 on Windows consoles ----------
 try:
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -62,24 +78,33 @@ def coerce_months(s: str | None):
         return None
 
 
+INSTANCE_ALIASES = {
+    "worldwide": "worldwide (standard multi-tenant)",
+    "standard multi-tenant": "worldwide (standard multi-tenant)",
+    "worldwide (standard multi-tenant)": "worldwide (standard multi-tenant)",
+    "gcc high": "gcc high",
+    "gcch": "gcc high",
+    "us dod": "dod",
+    "dod": "dod",
+    "us gcc": "gcc",
+    "gcc": "gcc",
+}
+
+
 def norm_instance(s: str) -> str:
     if not s:
         return ""
     t = s.strip().lower()
-    if t in ("worldwide", "standard multi-tenant", "worldwide (standard multi-tenant)"):
-        return "worldwide (standard multi-tenant)"
-    if t in ("gcc high", "gcch"):
-        return "gcc high"
-    if t in ("us dod", "dod"):
-        return "dod"
-    if t in ("us gcc", "gcc"):
-        return "gcc"
-    return t  # leave other values as-is (lowercased)
+    return INSTANCE_ALIASES.get(t, t)  # leave other values as-is (lowercased)
 
 
 def parse_isoish(dt_str: str | None):
     if not dt_str:
         return None
+    # Every format below starts with a 4-digit year, so fuzzy values ('August CY2025',
+    # 'Q3 CY2025') bail out here instead of raising once per format.
+    if not dt_str[:4].isdigit():
+        return None
     fmts = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ")
     for fmt in fmts:
         try:
@@ -95,7 +120,7 @@ def parse_m365_fuzzy(dt_str: str | None):
         return None
     s = dt_str.strip()
     # Remove "CY"
-    s = re.sub(r"\bCY\s*", "", s, flags=re.IGNORECASE)
+    s = RE_CY.sub("", s)
 
     # Month Year
     try:
@@ -104,7 +129,7 @@ def parse_m365_fuzzy(dt_str: str | None):
         pass
 
     # Quarter
-    m = re.match(r"^Q([1-4])\s+(\d{4})$", s, re.IGNORECASE)
+    m = RE_QUARTER.match(s)
     if m:
         q = int(m.group(1))
         y = int(m.group(2))
@@ -112,7 +137,7 @@ def parse_m365_fuzzy(dt_str: str | None):
         return datetime(y, start_month, 1)
 
     # Half
-    m = re.match(r"^H([12])\s+(\d{4})$", s, re.IGNORECASE)
+    m = RE_HALF.match(s)
     if m:
         h = int(m.group(1))
         y = int(m.group(2))
@@ -120,7 +145,7 @@ def parse_m365_fuzzy(dt_str: str | None):
         return datetime(y, start_month, 1)
 
     # Year only
-    m = re.match(r"^(\d{4})$", s)
+    m = RE_YEAR.match(s)
     if m:
         return datetime(int(m.group(1)), 1, 1)
 
@@ -174,6 +199,13 @@ def instance_allowed(item, include_set, exclude_set):
     return True
 
 
+def months_window(months: int, now: datetime | None = None):
+    """(since, until) covering the last N calendar months, as naive UTC like parsed dates."""
+    if now is None:
+        now = datetime.now(UTC).replace(tzinfo=None)
+    return now - relativedelta(months=months), now
+
+
 def in_date_window(item, months, since_dt, until_dt, keep_undated=False):
     """
     Date filter using several fields. If any filter is set and no date is parseable,
@@ -203,10 +235,8 @@ def in_date_window(item, months, since_dt, until_dt, keep_undated=False):
 
     dt = min(parsed)  # representative
 
-    now = datetime.utcnow()
     if months:
-        since_calc = now - timedelta(days=int(30.44 * months))
-        until_calc = now
+        since_calc, until_calc = months_window(months)
         return since_calc <= dt <= until_calc
 
     if since_dt and dt < since_dt:
@@ -216,6 +246,62 @@ def in_date_window(item, months, since_dt, until_dt, keep_undated=False):
     return True
 
 
+CSV_HEADERS = ("id", "title", "status", "phase", "targeted_dates", "cloud_instances", "link")
+
+
+def csv_row(it):
+    """Map one API item to a CSV tuple in CSV_HEADERS order."""
+    iid = it.get("id") or it.get("Id") or it.get("featureId") or ""
+    title = it.get("title") or it.get("Title") or ""
+    status = it.get("status") or it.get("Status") or it.get("publicRoadmapStatus") or ""
+
+    # Phase may be list[str] or list[dict]
+    phase = ""
+    tc = it.get("tagsContainer") or it.get("TagsContainer") or {}
+    phases = tc.get("releasePhase") or tc.get("ReleasePhase") or []
+    if isinstance(phases, list) and phases:
+        first = phases[0]
+        if isinstance(first, dict):
+            phase = first.get("tagName") or first.get("name") or first.get("value") or ""
+        else:
+            phase = str(first)
+
+    targeted = it.get("releaseDate") or it.get("publicPreviewDate") or it.get("rolloutStart") or ""
+
+    clouds = instances_for(it)
+    link = f"https://www.microsoft.com/microsoft-365/roadmap?featureid={iid}" if iid else ""
+
+    return (
+        str(iid),
+        clean_text(title),
+        clean_text(status),
+        clean_text(phase),
+        clean_text(targeted),
+        ";".join(clouds),
+        link,
+    )
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or text; orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def fetch_api_json(sess, cache_dir=""):
+    """GET the roadmap API; with cache_dir, revalidate a stored copy via ETag/Last-Modified."""
+    if not cache_dir:
+        resp = sess.get(API, timeout=60)
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
+    # Local helper (same folder); only needed when caching
+    from fallback_rss_api import cached_get  # lazy import
+
+    return _json_loads(cached_get(API, "application/json", cache_dir, sess).read_bytes())
+
+
 # ---------- main ----------
 
 
@@ -231,6 +317,7 @@ def main():
     ap.add_argument("--out", default="")
     ap.add_argument("--max-items", type=int, default=0)
     ap.add_argument("--max-pages", type=int, default=None)  # ignored; compat
+    ap.add_argument("--cache-dir", default="")
     ap.add_argument("--debug", action="store_true")
     args = ap.parse_args()
 
@@ -238,6 +325,10 @@ def main():
     since_dt = datetime.strptime(args.since, "%Y-%m-%d") if args.since else None
     until_dt = datetime.strptime(args.until, "%Y-%m-%d") if args.until else None
     keep_undated = args.keep_undated.lower() == "true"
+    if months:
+        # Resolve the months window once instead of per item (months wins over since/until)
+        since_dt, until_dt = months_window(months)
+        months = None
 
     include_set = set(x.strip().lower() for x in args.include.split(",") if x.strip())
     exclude_set = set(x.strip().lower() for x in args.exclude.split(",") if x.strip())
@@ -246,9 +337,7 @@ def main():
     sess.headers.update(
         {"User-Agent": "RoadmapFetcher/1.6 (+https://github.com/ShannonBrayNC/m365-roadmap)"}
     )
-    resp = sess.get(API, timeout=60)
-    resp.raise_for_status()
-    data = resp.json()
+    data = fetch_api_json(sess, args.cache_dir)
 
     if args.debug:
         print(f"[debug] total items from API: {len(data)}", file=sys.stderr)
@@ -287,54 +376,12 @@ def main():
 
         def write_csv(fh):
             w = csv.writer(fh)
-            w.writerow(
-                ["id", "title", "status", "phase", "targeted_dates", "cloud_instances", "link"]
-            )
-            for it in out_items:
-                iid = it.get("id") or it.get("Id") or it.get("featureId") or ""
-                title = it.get("title") or it.get("Title") or ""
-                status = it.get("status") or it.get("Status") or it.get("publicRoadmapStatus") or ""
-
-                # Phase may be list[str] or list[dict]
-                phase = ""
-                tc = it.get("tagsContainer") or it.get("TagsContainer") or {}
-                phases = tc.get("releasePhase") or tc.get("ReleasePhase") or []
-                if isinstance(phases, list) and phases:
-                    first = phases[0]
-                    if isinstance(first, dict):
-                        phase = (
-                            first.get("tagName") or first.get("name") or first.get("value") or ""
-                        )
-                    else:
-                        phase = str(first)
-
-                targeted = (
-                    it.get("releaseDate")
-                    or it.get("publicPreviewDate")
-                    or it.get("rolloutStart")
-                    or ""
-                )
-
-                clouds = instances_for(it)
-                link = (
-                    f"https://www.microsoft.com/microsoft-365/roadmap?featureid={iid}"
-                    if iid
-                    else ""
-                )
-
-                row = [
-                    str(iid),
-                    clean_text(title),
-                    clean_text(status),
-                    clean_text(phase),
-                    clean_text(targeted),
-                    ";".join(clouds),
-                    link,
-                ]
-                w.writerow(row)
+            w.writerow(CSV_HEADERS)
+            w.writerows(csv_row(it) for it in out_items)
 
         if args.out:
-            with open(args.out, "w", encoding="utf-8", newline="") as fh:
+            # 1 MiB buffer: large exports go to disk in a few big writes
+            with open(args.out, "w", encoding="utf-8", newline="", buffering=1 << 20) as fh:
                 write_csv(fh)
         else:
             write_csv(sys.stdout)
@@ -6,23 +6,43 @@ from __future__ import annotations
 import argparse
 import base64
 import csv
+import io
 import json
 import os
 import re
 import sys
-from dataclasses import asdict, dataclass
-from datetime import datetime, timedelta, timezone
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
-
-# External deps expected in the runner (as in your workflow):
-#   msal, requests, cryptography
-import requests
-import msal
-from cryptography.hazmat.primitives.serialization import Encoding, NoEncryption, PrivateFormat
-from cryptography.hazmat.primitives import hashes
-from cryptography import x509
-from cryptography.hazmat.primitives.serialization.pkcs12 import load_key_and_certificates
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import quote
+
+# External deps expected in the runner (as in your workflow): msal, requests, cryptography.
+# They are imported on the Graph path only, so --no-graph runs skip their import cost.
+if TYPE_CHECKING:
+    import msal
+    import requests
+
+try:
+    import orjson  # optional: C-level JSON encode/decode, stdlib json otherwise
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 
 # ----------------------------
@@ -44,13 +64,44 @@ FIELD_ORDER: List[str] = [
 
 RE_ID = re.compile(r"\b(\d{5,6})\b")
 RE_ID_VERBOSE = re.compile(r"Roadmap\s*ID[:\s]*([0-9]{5,6})", re.I)
+# Both patterns as one alternation so each text is scanned once (group 1 = verbose hit).
+RE_ID_ANY = re.compile(RE_ID_VERBOSE.pattern + "|" + RE_ID.pattern, re.I)
+
+# Cloud fields are "A; B" or "A, B": fold ',' into ';' and split in C (no regex).
+_CLOUD_DELIM_TRANS = str.maketrans({",": ";"})
+_ID_SEP_TRANS = str.maketrans({",": " ", "|": " "})
+# Lower-cased label → canonical cloud name (see normalize_clouds)
+_CLOUD_ALIASES = {
+    "general": "General",
+    "worldwide": "General",
+    "worldwide (standard multi-tenant)": "General",
+    "standard multi-tenant": "General",
+    "commercial": "General",
+    "gcc": "GCC",
+    "us gcc": "GCC",
+    "gcch": "GCC High",
+    "gcc high": "GCC High",
+    "gcc-high": "GCC High",
+    "gcc_high": "GCC High",
+    "dod": "DoD",
+    "us dod": "DoD",
+}
+_GENERAL = frozenset({"General"})
+
+# CSV header line; rows without quoting-sensitive characters bypass csv.writer.
+_CSV_HEADER = ",".join(FIELD_ORDER) + "\r\n"
+_CSV_SEPS = len(FIELD_ORDER) - 1
+_WRITE_BUFFER = 1 << 20
 
 GRAPH_SCOPE = "https://graph.microsoft.com/.default"
 GRAPH_BASE = "https://graph.microsoft.com"
-GRAPH_ENDPOINT = "/beta/admin/serviceAnnouncement/messages?$top=200"
+# Only the fields read when building Rows; Graph carries $select into @odata.nextLink.
+# externalLink is not a serviceUpdateMessage property: naming it here is a 400.
+GRAPH_SELECT = "id,title,services,category,lastModifiedDateTime,body"
+GRAPH_ENDPOINT = f"/beta/admin/serviceAnnouncement/messages?$top=200&$select={GRAPH_SELECT}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     PublicId: str = ""
     Title: str = ""
@@ -64,10 +115,77 @@ class Row:
     MessageId: str = ""
 
 
+_FIELD_SET = frozenset(FIELD_ORDER)
+
+# The delta query never reports retired or deleted messages, so --message-cache does a
+# full fetch (and drops whatever Graph no longer returns) once the cache is this old.
+_MESSAGE_CACHE_MAX_AGE = timedelta(days=7)
+
+# All FIELD_ORDER values of a Row as one tuple, fetched in C.
+_row_values = attrgetter(*FIELD_ORDER)
+
+
+def _row_to_dict(r: Row) -> Dict[str, str]:
+    # Spelled out (keys in FIELD_ORDER): a dict display with direct slot reads beats
+    # both a getattr comprehension and dict(zip(...)) by ~2.5x.
+    return {
+        "PublicId": r.PublicId,
+        "Title": r.Title,
+        "Source": r.Source,
+        "Product_Workload": r.Product_Workload,
+        "Status": r.Status,
+        "LastModified": r.LastModified,
+        "ReleaseDate": r.ReleaseDate,
+        "Cloud_instance": r.Cloud_instance,
+        "Official_Roadmap_link": r.Official_Roadmap_link,
+        "MessageId": r.MessageId,
+    }
+
+
 # ----------------------------
 # Utilities
 # ----------------------------
 
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or text; orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+@contextmanager
+def _atomic_open(path: str | Path) -> Iterator[BinaryIO]:
+    """Write to a temp file beside ``path`` through a 1 MiB buffer, then os.replace() it in.
+
+    Readers (and a crashed run) never see a half-written output file. The temp name is
+    unique per writer and opened exclusively, so concurrent runs cannot truncate or swap in
+    each other's partial output; unlike mkstemp it keeps the usual umask file mode.
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(f"{p.name}.{os.urandom(4).hex()}.tmp")
+    # Opened outside the try: a name clash is not ours to unlink
+    f = open(tmp, "xb", buffering=_WRITE_BUFFER)  # noqa: SIM115
+    try:
+        with f:
+            yield f
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _write_bytes_atomic(path: str | Path, data: bytes) -> None:
+    with _atomic_open(path) as f:
+        f.write(data)
+
+
 def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--config", help="graph_config.json path", default="graph_config.json")
@@ -76,9 +194,22 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p.add_argument("--cloud", action="append", default=[], help="Cloud label; repeatable")
     p.add_argument("--no-graph", action="store_true", help="Skip Graph (fallback only)")
     p.add_argument("--seed-ids", default="", help="Comma/space/pipe-separated PublicIds to include")
-    p.add_argument("--emit", choices=["csv", "json"], required=True)
+    p.add_argument("--emit", choices=["csv", "json", "jsonl"], required=True)
     p.add_argument("--out", required=True)
     p.add_argument("--stats-out", default="")
+    p.add_argument(
+        "--message-cache",
+        default="",
+        help=(
+            "JSON cache of Graph rows; later runs only fetch messages changed since. "
+            "Refetched in full every 7 days so retired/deleted messages drop out"
+        ),
+    )
+    p.add_argument(
+        "--token-cache",
+        default="",
+        help="MSAL token cache file; reused across runs while the token is valid",
+    )
     return p.parse_args(argv)
 
 
@@ -87,13 +218,25 @@ def _read_cfg(path: str) -> Dict[str, Any]:
     if not p.exists():
         return {}
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return _json_loads(p.read_bytes())
     except Exception:
         return {}
 
 
+@lru_cache(maxsize=4)
 def _b64_to_cert_dict(pfx_b64: str, password: str) -> Dict[str, str]:
-    """Decode base64 PFX → msal cert dict {'thumbprint','private_key','public_certificate'}."""
+    """Decode base64 PFX → msal cert dict {'thumbprint','private_key','public_certificate'}.
+
+    Memoized per process: PKCS#12 parsing and the thumbprint hash only run once.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.serialization import (
+        Encoding,
+        NoEncryption,
+        PrivateFormat,
+    )
+    from cryptography.hazmat.primitives.serialization.pkcs12 import load_key_and_certificates
+
     data = base64.b64decode(pfx_b64)
     key, cert, addl = load_key_and_certificates(data, password.encode("utf-8"))
     if cert is None or key is None:
@@ -115,6 +258,36 @@ def _b64_to_cert_dict(pfx_b64: str, password: str) -> Dict[str, str]:
     return {"thumbprint": thumb, "private_key": priv_pem, "public_certificate": pub_pem}
 
 
+def _load_token_cache(path: str) -> Optional[msal.SerializableTokenCache]:
+    if not path:
+        return None
+    import msal
+
+    cache = msal.SerializableTokenCache()
+    p = Path(path)
+    if p.exists():
+        with suppress(Exception):  # unreadable/stale cache → start fresh
+            cache.deserialize(p.read_text(encoding="utf-8"))
+    return cache
+
+
+def _save_token_cache(path: str, cache: Optional[msal.SerializableTokenCache]) -> None:
+    if not path or cache is None or not cache.has_state_changed:
+        return
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp gives each writer its own 0600 file, swapped in atomically: concurrent CI jobs
+    # never read (or replace in) a half-written cache, and the token is never world-readable.
+    fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=p.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(cache.serialize())
+        os.replace(tmp, p)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
 def _when_from_flags(since: str, months: str) -> Optional[datetime]:
     if since:
         return datetime.fromisoformat(since).replace(tzinfo=timezone.utc)
@@ -127,15 +300,109 @@ def _when_from_flags(since: str, months: str) -> Optional[datetime]:
     return None
 
 
+def _since_cutoff(since_dt: datetime) -> str:
+    """since_dt as the UTC literal for a Graph $filter (whole seconds; rounds down)."""
+    return since_dt.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _modified_before(lm: str, since_dt: datetime) -> bool:
+    """True when a lastModified value is older than since_dt; unparseable values are kept."""
+    try:
+        return datetime.fromisoformat(lm) < since_dt  # 3.11+ accepts the trailing "Z"
+    except Exception:
+        return False
+
+
+# Graph's "YYYY-MM-DDTHH:MM:SS[.f+]Z" with every field range-checked; days 29-31 are left to
+# fromisoformat, which knows month lengths and leap years. Group 1 = fractional digits.
+_RE_PLAIN_STAMP = re.compile(
+    r"(?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.(\d+))?Z",
+    re.ASCII,
+)
+
+
+def _sort_stamp(lm: str) -> Tuple[int, str]:
+    """Sort key for LastModified: (0, isoformat) when parseable, else (1, "").
+
+    Stamps matching _RE_PLAIN_STAMP are rendered straight to the string
+    fromisoformat(...).isoformat() would produce (fraction truncated to 6 digits, omitted
+    when zero), without building a datetime; anything else is parsed.
+    """
+    m = _RE_PLAIN_STAMP.fullmatch(lm)
+    if m:
+        us = (m.group(1) or "")[:6].ljust(6, "0")
+        return (0, lm[:19] + ("+00:00" if us == "000000" else f".{us}+00:00"))
+    try:
+        return (0, datetime.fromisoformat(lm.replace("Z", "+00:00")).isoformat())
+    except Exception:
+        return (1, "")
+
+
+def _filter_since(
+    items: List[Dict[str, Any]], since_dt: Optional[datetime]
+) -> List[Dict[str, Any]]:
+    """Drop messages last modified before since_dt (undated messages are kept)."""
+    if since_dt is None:
+        return items
+    kept: List[Dict[str, Any]] = []
+    for m in items:
+        lm = (m.get("lastModifiedDateTime") or "").strip()
+        if lm and _modified_before(lm, since_dt):
+            continue
+        kept.append(m)
+    return kept
+
+
+def _load_message_cache(path: str) -> Tuple[Dict[str, Dict[str, str]], Optional[datetime]]:
+    """MessageId → Row fields from a previous run, and when it last did a full fetch.
+
+    ({}, None) when disabled, missing, unreadable or older than _MESSAGE_CACHE_MAX_AGE,
+    and also when any entry is not exactly the FIELD_ORDER string fields: a stale layout
+    forces a full refresh, since dropping single entries would hide them from the
+    lastModified delta query for good.
+    """
+    miss: Tuple[Dict[str, Dict[str, str]], Optional[datetime]] = ({}, None)
+    if not path:
+        return miss
+    p = Path(path)
+    if not p.exists():
+        return miss
+    try:
+        data = _json_loads(p.read_bytes())
+        refreshed = datetime.fromisoformat(data["refreshed"])
+        messages = data["messages"]
+    except Exception:
+        return miss
+    if refreshed.tzinfo is None or datetime.now(UTC) - refreshed > _MESSAGE_CACHE_MAX_AGE:
+        return miss
+    if not isinstance(messages, dict):
+        return miss
+    for fields in messages.values():
+        if not isinstance(fields, dict) or fields.keys() != _FIELD_SET:
+            return miss
+        if not all(isinstance(v, str) for v in fields.values()):
+            return miss
+    return messages, refreshed
+
+
+def _save_message_cache(
+    path: str, cache: Dict[str, Dict[str, str]], refreshed: datetime
+) -> None:
+    if not path:
+        return
+    _write_bytes_atomic(path, _json_dumps({"refreshed": refreshed.isoformat(), "messages": cache}))
+
+
 def _extract_public_id(msg: Dict[str, Any]) -> str:
-    # Prefer explicit hint in body or links
+    # Prefer an explicit "Roadmap ID" hint; otherwise the first bare 5-6 digit number
     body = (msg.get("body", {}) or {}).get("content", "") or ""
-    link = msg.get("externalLink", "") or ""
-    for txt in (link, body):
-        m = RE_ID_VERBOSE.search(txt) or RE_ID.search(txt)
-        if m:
+    plain = ""
+    for m in RE_ID_ANY.finditer(body):
+        if m.group(1):
             return m.group(1)
-    return ""
+        plain = plain or m.group(2)
+    return plain
 
 
 def _official_link(public_id: str) -> str:
@@ -144,45 +411,278 @@ def _official_link(public_id: str) -> str:
     return f"https://www.microsoft.com/microsoft-365/roadmap?filters=&searchterms={public_id}"
 
 
-def _write_csv(path: str | Path, rows: List[Row]) -> None:
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=FIELD_ORDER)
-        w.writeheader()
+def _write_csv(path: str | Path, rows: Iterable[Row]) -> None:
+    with _atomic_open(path) as f:
+        out = io.TextIOWrapper(f, encoding="utf-8", newline="")
+        quoted = csv.writer(out)  # one long-lived writer for rows that need quoting
+        write = out.write
+        write(_CSV_HEADER)
         for r in rows:
-            w.writerow({k: asdict(r).get(k, "") for k in FIELD_ORDER})
+            values = _row_values(r)
+            line = ",".join(values)
+            # Fast path: IDs, ISO dates, links etc. never need quoting; check the row once.
+            if (
+                line.count(",") == _CSV_SEPS
+                and '"' not in line
+                and "\n" not in line
+                and "\r" not in line
+            ):
+                write(line + "\r\n")
+            else:
+                quoted.writerow(values)
+        out.flush()
+        out.detach()
+
+
+def _write_json(path: str | Path, rows: Iterable[Row]) -> None:
+    """Indented JSON array, framed by hand so only one row is encoded at a time.
+
+    Each object is dumped with indent and shifted two spaces, which is byte-for-byte
+    what dumping the whole list would produce (string values never hold raw newlines).
+    """
+    with _atomic_open(path) as f:
+        sep = b"[\n  "
+        for r in rows:
+            f.write(sep)
+            f.write(_json_dumps(_row_to_dict(r), indent=True).replace(b"\n", b"\n  "))
+            sep = b",\n  "
+        f.write(b"[]" if sep == b"[\n  " else b"\n]")
 
 
-def _write_json(path: str | Path, rows: List[Row]) -> None:
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        payload = [{k: asdict(r).get(k, "") for k in FIELD_ORDER} for r in rows]
-        json.dump(payload, f, indent=2)
+def _write_jsonl(path: str | Path, rows: Iterable[Row]) -> None:
+    """JSON Lines: one compact object per row, streamed without building a list."""
+    with _atomic_open(path) as f:  # its 1 MiB buffer does the batching
+        for r in rows:
+            f.write(_json_dumps(_row_to_dict(r)) + b"\n")
 
 
 def _save_stats(path: str | Path, stats: Dict[str, Any]) -> None:
     if not path:
         return
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+    _write_bytes_atomic(path, _json_dumps(stats, indent=True))
+
+
+def extract_clouds(cloud_field: str) -> set[str]:
+    """Split a ';'/','-separated Cloud_instance value into a set of labels."""
+    if not cloud_field:
+        return set()
+    parts = cloud_field.translate(_CLOUD_DELIM_TRANS).split(";")
+    return {p.strip() for p in parts if p.strip()}
+
+
+@lru_cache(maxsize=256)
+def _normalize_cached(labels: Tuple[str, ...]) -> frozenset[str]:
+    out = set()
+    for label in labels:
+        key = label.strip().lower()
+        if key:
+            out.add(_CLOUD_ALIASES.get(key, label.strip()))
+    return frozenset(out)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_field(cloud_field: str) -> frozenset[str]:
+    """Canonical clouds for one Cloud_instance string; a handful of distinct values repeat."""
+    return _normalize_cached(tuple(cloud_field.translate(_CLOUD_DELIM_TRANS).split(";")))
+
+
+def normalize_clouds(labels: str | Iterable[str]) -> set[str]:
+    """Map cloud labels (one ';'/','-separated string or an iterable) to canonical names.
+
+    Unknown labels are kept as given (stripped).
+    """
+    if isinstance(labels, str):
+        return set(_normalize_field(labels))
+    return set(_normalize_cached(tuple(labels)))
+
+
+@lru_cache(maxsize=1024)
+def _include_cached(cloud_field: str, selected: frozenset[str]) -> bool:
+    # A blank Cloud_instance means the worldwide service, as in generate_report.
+    return not selected.isdisjoint(_normalize_field(cloud_field) or _GENERAL)
+
+
+def include_by_cloud(cloud_field: str, selected: Iterable[str]) -> bool:
+    """True when the row's clouds overlap the selection; an empty selection keeps everything."""
+    if not selected:
+        return True
+    return _include_cached(cloud_field or "", _normalize_cached(tuple(selected)))
+
+
+def _matches_products(text: str, products: Iterable[str]) -> bool:
+    """Substring match against lower-cased product filters; no filters keeps everything."""
+    if not products:
+        return True
+    low = text.lower()
+    return any(p in low for p in products)
+
+
+def _transform_items(
+    items: Iterable[Dict[str, Any]], clouds: Iterable[str], products: Iterable[str]
+) -> List[Dict[str, Any]]:
+    # Selection and product filters are canonicalized once per call; per row the cloud
+    # check is a cached frozenset lookup plus one isdisjoint (no set is allocated).
+    sel = _normalize_cached(tuple(clouds)) if clouds else frozenset()
+    want = [p.lower() for p in products]
+    out: List[Dict[str, Any]] = []
+    for it in items:
+        raw = it.get("clouds") or ""
+        have = _normalize_field(raw) if isinstance(raw, str) else _normalize_cached(tuple(raw))
+        if sel and sel.isdisjoint(have or _GENERAL):
+            continue
+        product = it.get("product") or ",".join(it.get("services") or [])
+        if not _matches_products(product, want):
+            continue
+        out.append(dict(it, title=(it.get("title") or "").strip(), product=product))
+    return out
+
+
+def transform_graph_messages(
+    items: Iterable[Dict[str, Any]], clouds: Iterable[str], products: Iterable[str]
+) -> List[Dict[str, Any]]:
+    """Keep Graph messages whose clouds overlap ``clouds`` and whose product matches."""
+    return _transform_items(items, clouds, products)
+
+
+def transform_public_items(
+    items: Iterable[Dict[str, Any]], clouds: Iterable[str], products: Iterable[str]
+) -> List[Dict[str, Any]]:
+    """Keep public roadmap items whose clouds overlap ``clouds`` and whose product matches."""
+    return _transform_items(items, clouds, products)
+
+
+def transform_rss(xml_text: str | bytes, products: Iterable[str]) -> List[Dict[str, str]]:
+    """Pull-parse RSS <item>s (title/link/pubDate) and keep those whose title matches.
+
+    Each item is cleared and detached from its parent once copied out (the same
+    lxml idiom as fallback_rss_api._parse_xml_items), so the parsed tree does not
+    grow with the feed; only the kept rows and the input bytes stay in memory.
+    """
+    from lxml import etree  # type: ignore[import-untyped]  # lazy import
+
+    data = xml_text.encode("utf-8") if isinstance(xml_text, str) else xml_text
+    want = [p.lower() for p in products]
+    out: List[Dict[str, str]] = []
+    source = io.BytesIO(data.strip())
+    for _event, el in etree.iterparse(source, events=("end",), tag=("item", "{*}item")):
+        title = (el.findtext("title") or "").strip()
+        if _matches_products(title, want):
+            out.append(
+                {
+                    "title": title,
+                    "link": (el.findtext("link") or "").strip(),
+                    "pubDate": (el.findtext("pubDate") or "").strip(),
+                }
+            )
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+    return out
+
+
+def _dedup_rows(*tiers: Iterable[Row]) -> List[Row]:
+    """Single pass over each source in priority order; first occurrence wins.
+
+    Rows are keyed on (PublicId, MessageId); a seed placeholder is also dropped when an
+    earlier row already carries its PublicId. Taking the sources separately means the
+    caller never has to concatenate them first.
+    """
+    seen: set[Tuple[str, str]] = set()
+    have_ids: set[str] = set()
+    out: List[Row] = []
+    for tier in tiers:
+        for r in tier:
+            key = (r.PublicId, r.MessageId)
+            if key in seen or (r.Source == "seed" and r.PublicId in have_ids):
+                continue
+            seen.add(key)
+            if r.PublicId:
+                have_ids.add(r.PublicId)
+            out.append(r)
+    return out
 
 
 def _split_ids(s: str) -> List[str]:
     if not s:
         return []
-    # allow comma/pipe/space
-    parts = re.split(r"[,\s|]+", s.strip())
-    return [p for p in parts if p]
+    # allow comma/pipe/space: map the separators to spaces, then str.split() does the rest
+    return s.translate(_ID_SEP_TRANS).split()
 
 
 # ----------------------------
 # Graph fetch
 # ----------------------------
 
-def _try_fetch_graph(cfg: Dict[str, Any], since_dt: Optional[datetime]) -> Tuple[List[Row], Optional[str]]:
+def _graph_session() -> requests.Session:
+    """Keep-alive session for paging: one TLS handshake, retries honour Retry-After."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+    return session
+
+
+def _get_json(session: requests.Session, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    resp = session.get(url, headers=headers, timeout=30)
+    resp.raise_for_status()
+    data = _json_loads(resp.content)
+    return data if isinstance(data, dict) else {}
+
+
+def _iter_graph_pages(
+    session: requests.Session, url: str, headers: Dict[str, str]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield each page's "value" list, following @odata.nextLink.
+
+    The next page is requested on a worker thread as soon as its link is known, so its
+    round trip overlaps with the caller processing the current page.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending: Optional[Future[Dict[str, Any]]] = pool.submit(_get_json, session, url, headers)
+        while pending is not None:
+            data = pending.result()
+            next_link = data.get("@odata.nextLink")
+            pending = pool.submit(_get_json, session, next_link, headers) if next_link else None
+            yield data.get("value", []) or []
+
+
+def _iter_rows_from_messages(items: Iterable[Dict[str, Any]]) -> Iterator[Row]:
+    for m in items:
+        lm = (m.get("lastModifiedDateTime") or "").strip()
+        public_id = _extract_public_id(m)
+        title = (m.get("title") or "").strip()
+        prod = ",".join(m.get("services", []) or [])  # e.g. ["Microsoft Teams"]
+        msg_id = (m.get("id") or "").strip()
+        roadmap_link = _official_link(public_id)
+
+        yield Row(
+            PublicId=public_id,
+            Title=title,
+            Source="graph",
+            Product_Workload=prod,
+            Status=(m.get("category") or "").strip(),  # not perfect; placeholder
+            LastModified=lm,
+            ReleaseDate="",  # not provided by API; left blank
+            Cloud_instance="",  # not provided; blank → shown as em dash in UI
+            Official_Roadmap_link=roadmap_link,
+            MessageId=msg_id,
+        )
+
+
+def _try_fetch_graph(
+    cfg: Dict[str, Any],
+    since_dt: Optional[datetime],
+    token_cache: str = "",
+    message_cache: str = "",
+) -> Tuple[List[Row], Optional[str]]:
     tenant = (cfg.get("TENANT") or cfg.get("tenant") or "").strip()
     client = (cfg.get("CLIENT") or cfg.get("client") or "").strip()
     pfx_b64 = (cfg.get("PFX_B64") or cfg.get("pfx_base64") or "").strip()
@@ -196,60 +696,62 @@ def _try_fetch_graph(cfg: Dict[str, Any], since_dt: Optional[datetime]) -> Tuple
     except Exception as e:
         return [], f"PFX/token error: {e}"
 
+    import msal
+
+    cache = _load_token_cache(token_cache)
     app = msal.ConfidentialClientApplication(
         client_id=client,
         authority=f"https://login.microsoftonline.com/{tenant}",
         client_credential=cred,
+        token_cache=cache,
     )
 
+    # Served from the cache when a still-valid app token is present
     token = app.acquire_token_for_client(scopes=[GRAPH_SCOPE])
+    _save_token_cache(token_cache, cache)
     if "access_token" not in token:
         return [], f"Token failure: {token.get('error_description','unknown')}"
 
     headers = {"Authorization": f"Bearer {token['access_token']}"}
     url = GRAPH_BASE + GRAPH_ENDPOINT
+    rows: List[Row] = []
+
+    if not message_cache:
+        # Let Graph drop older messages instead of downloading their bodies;
+        # _filter_since still guards anything the service lets through.
+        if since_dt:
+            url += "&$filter=" + quote(f"lastModifiedDateTime ge {_since_cutoff(since_dt)}Z")
+        try:
+            with _graph_session() as session:
+                for page in _iter_graph_pages(session, url, headers):
+                    rows.extend(_iter_rows_from_messages(_filter_since(page, since_dt)))
+        except Exception as e:
+            return [], f"Graph GET failed: {e}"
+        return rows, None
+
+    # Incremental: only ask Graph for messages changed since the newest cached one,
+    # then merge over the cache. An empty (missing, stale or expired) cache means a
+    # full fetch, which also restarts the _MESSAGE_CACHE_MAX_AGE clock.
+    cached, refreshed = _load_message_cache(message_cache)
+    if refreshed is None:
+        refreshed = datetime.now(UTC)
+    newest = max((c.get("LastModified", "") for c in cached.values()), default="")
+    if newest:
+        url += "&$filter=" + quote(f"lastModifiedDateTime ge {newest}")
     try:
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
+        with _graph_session() as session:
+            for page in _iter_graph_pages(session, url, headers):
+                for r in _iter_rows_from_messages(page):
+                    cached[r.MessageId] = _row_to_dict(r)
     except Exception as e:
         return [], f"Graph GET failed: {e}"
+    _save_message_cache(message_cache, cached, refreshed)
 
-    items = data.get("value", []) if isinstance(data, dict) else []
-    rows: List[Row] = []
-
-    for m in items:
-        # Optional server-side time filter if supplied
-        lm = (m.get("lastModifiedDateTime") or "").strip()
-        if since_dt and lm:
-            try:
-                lm_dt = datetime.fromisoformat(lm.replace("Z", "+00:00"))
-                if lm_dt < since_dt:
-                    continue
-            except Exception:
-                pass
-
-        public_id = _extract_public_id(m)
-        title = (m.get("title") or "").strip()
-        prod = ",".join(m.get("services", []) or [])  # e.g. ["Microsoft Teams"]
-        msg_id = (m.get("id") or "").strip()
-        roadmap_link = _official_link(public_id)
-
-        rows.append(
-            Row(
-                PublicId=public_id,
-                Title=title,
-                Source="graph",
-                Product_Workload=prod,
-                Status=(m.get("category") or "").strip(),  # not perfect; placeholder
-                LastModified=lm,
-                ReleaseDate="",  # not provided by API; left blank
-                Cloud_instance="",  # not provided; blank → shown as em dash in UI
-                Official_Roadmap_link=roadmap_link,
-                MessageId=msg_id,
-            )
-        )
-
+    for fields in cached.values():
+        r = Row(**fields)
+        if since_dt and r.LastModified and _modified_before(r.LastModified, since_dt):
+            continue
+        rows.append(r)
     return rows, None
 
 
@@ -277,52 +779,53 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         )
 
     # Graph (unless explicitly disabled)
-    rows: List[Row] = []
+    graph_rows: List[Row] = []
     errors: int = 0
     sources = {"graph": 0, "public-json": 0, "rss": 0, "seed": 0}
 
     if not args.no_graph:
-        g_rows, g_err = _try_fetch_graph(cfg, since_dt)
+        g_rows, g_err = _try_fetch_graph(cfg, since_dt, args.token_cache, args.message_cache)
         if g_err:
             print(f"WARN: {g_err}")
             errors += 1
         else:
-            rows.extend(g_rows)
+            graph_rows = g_rows
             sources["graph"] += len(g_rows)
     else:
         print("INFO: --no-graph; skipping Graph fetch")
 
-    # Add seeds last (low-priority placeholder)
-    if seed_rows:
-        rows.extend(seed_rows)
-        sources["seed"] += len(seed_rows)
+    # Seeds go last (low-priority placeholder)
+    sources["seed"] += len(seed_rows)
+
+    fetched = len(graph_rows) + len(seed_rows)
+    rows = _dedup_rows(graph_rows, seed_rows)
+    deduped = fetched - len(rows)
 
     # Simple cloud filter is performed later in generate_report; here we just save master.
 
     # Sort newest first by LastModified when present
-    def _key(r: Row) -> Tuple[int, str]:
-        try:
-            return (0, datetime.fromisoformat((r.LastModified or "").replace("Z", "+00:00")).isoformat())
-        except Exception:
-            return (1, "")
-    rows.sort(key=_key, reverse=True)
+    rows.sort(key=lambda r: _sort_stamp(r.LastModified or ""), reverse=True)
 
     stats = {
         "rows": len(rows),
         "sources": sources,
         "errors": errors,
+        "deduped": deduped,
     }
 
     if args.emit == "csv":
         _write_csv(args.out, rows)
-        if args.stats_out:
-            _save_stats(args.stats_out, stats)
+    elif args.emit == "jsonl":
+        _write_jsonl(args.out, rows)
     else:
         _write_json(args.out, rows)
-        if args.stats_out:
-            _save_stats(args.stats_out, stats)
+    if args.stats_out:
+        _save_stats(args.stats_out, stats)
 
-    print(f"Done. rows={len(rows)} sources={json.dumps(sources)} errors={errors}")
+    print(
+        f"Done. rows={len(rows)} sources={json.dumps(sources)} errors={errors} "
+        f"dedup_removed={deduped}"
+    )
     # Optional file list (handy in CI)
     outdir = Path(args.out).parent
     try:
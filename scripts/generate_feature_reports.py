@@ -355,7 +355,7 @@ def main():
             ai_md = _summarize_with_openai(args.model, sys_prompt, up)
         sections.append(build_tailored_section(fid, base, public_index.get(fid), ai_md))
 
-    now = dt.datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
+    now = dt.datetime.now(dt.UTC).strftime("%Y-%m-%d %H:%M UTC")
     doc = f"# {args.title}\n\n_Generated {now}_\n\n" + "\n---\n\n".join(sections) + "\n"
     Path(args.out).parent.mkdir(parents=True, exist_ok=True)
     Path(args.out).write_text(doc, encoding="utf-8")
@@ -33,6 +33,10 @@ CSV_FIELDS = [
 ]
 
 
+# One comma/pipe/whitespace-separated item (--products, --forced-ids)
+_RE_LIST_ITEM = re.compile(r"[^,\s|]+")
+
+
 def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--title", required=True)
@@ -59,8 +63,8 @@ def _read_master_csv(path: str | Path) -> List[Dict[str, str]]:
 def _split_list(s: str) -> List[str]:
     if not s:
         return []
-    parts = re.split(r"[,\s|]+", s.strip())
-    return [p for p in parts if p]
+    # match the items rather than split on separators: no empty parts to filter out
+    return _RE_LIST_ITEM.findall(s)
 
 
 def _filter_by_cloud(rows: List[Dict[str, str]], clouds: List[str]) -> List[Dict[str, str]]:
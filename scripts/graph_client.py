@@ -11,9 +11,21 @@ try:
 except Exception:  # pragma: no cover
     requests = None  # type: ignore[assignment]
 
+try:
+    import orjson  # optional: C-level JSON decode, stdlib json otherwise
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or text; orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def load_config(path: str) -> dict[str, Any]:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    data = _json_loads(Path(path).read_bytes())
     return cast(dict[str, Any], data)
 
 
@@ -81,18 +93,43 @@ class GraphClient:
 
     def fetch_messages(self) -> list[dict[str, Any]]:
         """
-        Fetch admin messages (placeholder). Returns [] if network not available.
+        Fetch admin messages (placeholder), following @odata.nextLink so large
+        tenants are not truncated to the first page. All or nothing: returns []
+        if the network is unavailable or any page fails, never a silent prefix.
         """
         if requests is None:
             return []
         # You can customize the endpoint via config if desired
         base = self.cfg.get("graph_base", "https://graph.microsoft.com/beta")
-        url = f"{base}/admin/serviceAnnouncement/messages"
+        url: str | None = f"{base}/admin/serviceAnnouncement/messages"
+        headers = build_headers(self.token)
+        out: list[dict[str, Any]] = []
         try:
-            resp = requests.get(url, headers=build_headers(self.token), timeout=15)  # type: ignore[no-untyped-call]
-            if resp.status_code >= 400:
-                return []
-            payload = resp.json()
-            return cast(list[dict[str, Any]], payload.get("value", []))
+            with _session() as session:
+                while url:
+                    resp = session.get(url, headers=headers, timeout=15)
+                    if resp.status_code >= 400:
+                        return []
+                    payload = _json_loads(resp.content)
+                    out.extend(cast(list[dict[str, Any]], payload.get("value", [])))
+                    url = payload.get("@odata.nextLink")
         except Exception:
             return []
+        return out
+
+
+def _session() -> Any:
+    """Pooled session; 429 and 5xx GETs are retried with backoff, honoring Retry-After."""
+    from requests.adapters import HTTPAdapter  # lazy import
+    from urllib3.util.retry import Retry  # lazy import
+
+    s = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    s.mount("https://", HTTPAdapter(max_retries=retry))
+    return s
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+import scripts.fallback_rss_api as mod
+
+
+class _Resp:
+    def __init__(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None):
+        self.status_code = status
+        self._body = body
+        self.headers = headers or {}
+
+    def __enter__(self) -> _Resp:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        assert self.status_code < 400
+
+    def iter_content(self, **_: Any) -> Iterator[bytes]:
+        yield self._body
+
+
+def test_cached_get_revalidates_with_etag(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[dict[str, str]] = []
+    replies = [
+        _Resp(200, b'[{"title": "x"}]', {"ETag": '"v1"'}),
+        _Resp(304),
+    ]
+
+    def fake_get(_url: str, headers: dict[str, str], **_: Any) -> _Resp:
+        sent.append(headers)
+        return replies.pop(0)
+
+    monkeypatch.setattr(mod._SESSION, "get", fake_get)
+
+    assert mod._fetch_json(tmp_path) == [{"title": "x"}]
+    assert mod._fetch_json(tmp_path) == [{"title": "x"}]  # served from disk on 304
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+
+
+def test_cached_get_failed_download_leaves_no_temp_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _ResetResp(_Resp):
+        def iter_content(self, **_: Any) -> Iterator[bytes]:
+            yield b'[{"title": '
+            raise requests.ConnectionError("connection reset")
+
+    monkeypatch.setattr(mod._SESSION, "get", lambda *_, **__: _ResetResp(200))
+    for _ in range(3):
+        with pytest.raises(requests.ConnectionError):
+            mod.cached_get(mod.FEED_URL, "application/json", tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parse_xml_items_recovers_from_bare_ampersand() -> None:
+    feed = (
+        b"<rss><channel>"
+        b"<item><title>A & B featureid=123456</title><link>l1</link></item>"
+        b"<item><title>Next</title><link>l2</link></item>"
+        b"</channel></rss>"
+    )
+    items = mod._parse_xml_items(io.BytesIO(feed))
+    assert [i["link"] for i in items] == ["l1", "l2"]
+    assert "featureid=123456" in items[0]["title"]
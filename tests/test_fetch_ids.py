@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import scripts.fetch_ids as mod
+
+
+def test_fetch_api_json_reads_through_cached_get(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # cached_get's revalidation is covered in test_fallback_rss_api; only the wiring is new here
+    calls: list[tuple[str, str, str, object]] = []
+    body = tmp_path / "payload"
+    body.write_bytes(b'[{"id": 123456}]')
+
+    def fake_cached_get(url: str, accept: str, cache_dir: str, session: object) -> Path:
+        calls.append((url, accept, cache_dir, session))
+        return body
+
+    monkeypatch.setitem(
+        sys.modules, "fallback_rss_api", types.SimpleNamespace(cached_get=fake_cached_get)
+    )
+    sess = object()
+
+    assert mod.fetch_api_json(sess, str(tmp_path)) == [{"id": 123456}]
+    assert calls == [(mod.API, "application/json", str(tmp_path), sess)]
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
+import os
+import sys
+import types
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
+import pytest
+
 import scripts.fetch_messages_graph as mod
 
 
@@ -42,3 +52,255 @@ def test_transform_rss_uses_product_filter() -> None:
     rows = mod.transform_rss(xml, {"teams"})
     assert len(rows) == 1
     assert rows[0]["title"] == "Teams update"
+
+
+def test_write_csv_matches_stdlib_quoting(tmp_path: Path) -> None:
+    rows = [
+        mod.Row(PublicId="123456", Title="Plain title", Source="graph", MessageId="MC1"),
+        mod.Row(PublicId="234567", Title='Quoted "title", with comma', Source="graph"),
+        mod.Row(PublicId="345678", Title="Multi\nline", Product_Workload="Teams,SharePoint"),
+    ]
+    out = tmp_path / "master.csv"
+    mod._write_csv(out, rows)
+
+    expected = io.StringIO(newline="")
+    w = csv.writer(expected)
+    w.writerow(mod.FIELD_ORDER)
+    for r in rows:
+        w.writerow([getattr(r, k) for k in mod.FIELD_ORDER])
+    assert out.read_bytes() == expected.getvalue().encode("utf-8")
+
+
+@pytest.mark.parametrize("n", [0, 1, 3])
+def test_write_json_streams_same_bytes_as_full_dump(tmp_path: Path, n: int) -> None:
+    rows = [mod.Row(PublicId=str(i), Title=f'Title "{i}"\nnext') for i in range(n)]
+    out = tmp_path / "master.json"
+    mod._write_json(out, rows)
+    expected = mod._json_dumps([mod._row_to_dict(r) for r in rows], indent=True)
+    assert out.read_bytes() == expected
+
+
+def test_write_jsonl_one_object_per_line(tmp_path: Path) -> None:
+    rows = [
+        mod.Row(PublicId="123456", Title="Ünïcode\nline", MessageId="MC1"),
+        mod.Row(PublicId="234567", Title="Second"),
+    ]
+    out = tmp_path / "master.jsonl"
+    mod._write_jsonl(out, rows)
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {k: getattr(r, k) for k in mod.FIELD_ORDER} for r in rows
+    ]
+
+
+def test_filter_since_compares_graph_timestamps() -> None:
+    since = datetime(2025, 8, 1, 0, 0, 0, 100000, tzinfo=UTC)  # --months cutoffs carry µs
+    items = [
+        {"id": "old", "lastModifiedDateTime": "2025-07-31T23:59:59Z"},
+        {"id": "subsecond", "lastModifiedDateTime": "2025-08-01T00:00:00.050Z"},
+        {"id": "edge", "lastModifiedDateTime": "2025-08-01T00:00:00.123Z"},
+        {"id": "new", "lastModifiedDateTime": "2025-08-02T10:00:00Z"},
+        {"id": "offset", "lastModifiedDateTime": "2025-08-01T01:00:00+02:00"},
+        {"id": "undated", "lastModifiedDateTime": ""},
+    ]
+    kept = [m["id"] for m in mod._filter_since(items, since)]
+    assert kept == ["edge", "new", "undated"]
+
+
+@pytest.mark.parametrize(
+    "lm",
+    [
+        "2025-08-01T10:00:00Z",
+        "2025-08-01T10:00:00.5Z",
+        "2025-08-01T10:00:00.000Z",
+        "2025-08-01T10:00:00.1234567Z",
+        "2025-08-01T10:00:00+02:00",
+        "2025-08-01T10:00:00.Z",
+        "2025-13-45T99:99:99Z",
+        "2025-02-30T10:00:00Z",
+        "2024-02-29T10:00:00Z",
+        "2025-08-01T24:00:00Z",
+        "2025-08-01T10:00:60Z",
+        "0000-01-01T00:00:00Z",
+        "2025-0a-01T10:00:00Z",
+        "2025-08-01",
+        "",
+        "garbage",
+    ],
+)
+def test_sort_stamp_matches_fromisoformat(lm: str) -> None:
+    try:
+        expected = (0, datetime.fromisoformat(lm.replace("Z", "+00:00")).isoformat())
+    except ValueError:
+        expected = (1, "")
+    assert mod._sort_stamp(lm) == expected
+
+
+def test_iter_graph_pages_follows_next_link(monkeypatch: pytest.MonkeyPatch) -> None:
+    pages = {
+        "u1": {"value": [{"id": "MC1"}], "@odata.nextLink": "u2"},
+        "u2": {"value": [{"id": "MC2"}, {"id": "MC3"}]},
+    }
+    seen: list[str] = []
+
+    def fake_get_json(_session: Any, url: str, _headers: dict[str, str]) -> dict[str, Any]:
+        seen.append(url)
+        return pages[url]
+
+    monkeypatch.setattr(mod, "_get_json", fake_get_json)
+    ids = [m["id"] for page in mod._iter_graph_pages(mod._graph_session(), "u1", {}) for m in page]
+    assert ids == ["MC1", "MC2", "MC3"]
+    assert seen == ["u1", "u2"]
+
+
+def test_dedup_rows_drops_repeats_and_covered_seeds() -> None:
+    rows = [
+        mod.Row(PublicId="123456", Title="Graph", Source="graph", MessageId="MC1"),
+        mod.Row(PublicId="123456", Title="Graph again", Source="graph", MessageId="MC2"),
+        mod.Row(PublicId="123456", Title="Graph", Source="graph", MessageId="MC1"),
+        mod.Row(PublicId="123456", Title="[123456]", Source="seed"),
+        mod.Row(PublicId="999999", Title="[999999]", Source="seed"),
+        mod.Row(PublicId="999999", Title="[999999]", Source="seed"),
+    ]
+    kept = [(r.PublicId, r.MessageId, r.Source) for r in mod._dedup_rows(rows)]
+    assert kept == [
+        ("123456", "MC1", "graph"),
+        ("123456", "MC2", "graph"),
+        ("999999", "", "seed"),
+    ]
+
+
+def _graph_msg(mid: str, lm: str, title: str) -> dict[str, Any]:
+    return {
+        "id": mid,
+        "title": title,
+        "lastModifiedDateTime": lm,
+        "body": {"content": f"Roadmap ID: {mid[2:]}0000"},
+    }
+
+
+def _fake_graph_auth(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    class _App:
+        def __init__(self, **_: Any) -> None:
+            pass
+
+        def acquire_token_for_client(self, **_: Any) -> dict[str, str]:
+            return {"access_token": "t"}
+
+    fake_msal = types.SimpleNamespace(ConfidentialClientApplication=_App)
+    monkeypatch.setitem(sys.modules, "msal", fake_msal)
+    monkeypatch.setattr(mod, "_b64_to_cert_dict", lambda *_: {})
+    monkeypatch.setenv("M365_PFX_PASSWORD", "pw")  # pragma: allowlist secret
+    return {"TENANT": "t", "CLIENT": "c", "PFX_B64": "eA=="}
+
+
+def test_message_cache_incremental_fetch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg = _fake_graph_auth(monkeypatch)
+    cache = tmp_path / "messages.json"
+    runs = [
+        [
+            _graph_msg("MC1", "2025-08-01T00:00:00Z", "one"),
+            _graph_msg("MC2", "2025-08-02T00:00:00Z", "two"),
+        ],
+        [_graph_msg("MC2", "2025-08-03T00:00:00Z", "two, updated")],
+    ]
+    urls: list[str] = []
+
+    def fake_get_json(_session: Any, url: str, _headers: dict[str, str]) -> dict[str, Any]:
+        urls.append(url)
+        return {"value": runs.pop(0)}
+
+    monkeypatch.setattr(mod, "_get_json", fake_get_json)
+
+    rows, err = mod._try_fetch_graph(cfg, None, message_cache=str(cache))
+    assert err is None
+    assert sorted(r.MessageId for r in rows) == ["MC1", "MC2"]
+    assert "$filter" not in urls[0]
+    refreshed = json.loads(cache.read_text(encoding="utf-8"))["refreshed"]
+
+    since = datetime(2025, 8, 2, tzinfo=UTC)
+    rows, err = mod._try_fetch_graph(cfg, since, message_cache=str(cache))
+    assert err is None
+    assert urls[1].endswith("&$filter=lastModifiedDateTime%20ge%202025-08-02T00%3A00%3A00Z")
+    # MC2 merged over its cached copy; MC1 kept in the cache but outside --since
+    assert [(r.MessageId, r.Title) for r in rows] == [("MC2", "two, updated")]
+    saved = json.loads(cache.read_text(encoding="utf-8"))
+    assert set(saved["messages"]) == {"MC1", "MC2"}
+    assert saved["refreshed"] == refreshed  # delta runs keep the full-fetch time
+
+
+def test_expired_message_cache_is_refetched_in_full(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _fake_graph_auth(monkeypatch)
+    cache = tmp_path / "messages.json"
+    old = datetime.now(UTC) - mod._MESSAGE_CACHE_MAX_AGE - timedelta(hours=1)
+    retired = dict.fromkeys(mod.FIELD_ORDER, "")
+    retired.update(MessageId="MC9", LastModified="2025-08-05T00:00:00Z")
+    mod._save_message_cache(str(cache), {"MC9": retired}, old)
+    urls: list[str] = []
+
+    def fake_get_json(_session: Any, url: str, _headers: dict[str, str]) -> dict[str, Any]:
+        urls.append(url)
+        return {"value": [_graph_msg("MC1", "2025-08-01T00:00:00Z", "one")]}
+
+    monkeypatch.setattr(mod, "_get_json", fake_get_json)
+
+    rows, err = mod._try_fetch_graph(cfg, None, message_cache=str(cache))
+    assert err is None
+    assert "$filter" not in urls[0]
+    assert [r.MessageId for r in rows] == ["MC1"]  # MC9 no longer served by Graph
+    saved = json.loads(cache.read_text(encoding="utf-8"))
+    assert set(saved["messages"]) == {"MC1"}
+    assert datetime.fromisoformat(saved["refreshed"]) > old
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        {"Id": "renamed"},
+        "not a dict",
+        dict.fromkeys(mod.FIELD_ORDER, 1),
+    ],
+)
+def test_message_cache_with_stale_entry_is_a_miss(tmp_path: Path, entry: Any) -> None:
+    cache = tmp_path / "messages.json"
+    good = dict.fromkeys(mod.FIELD_ORDER, "")
+    refreshed = datetime.now(UTC).isoformat()
+    messages = {"MC1": good, "MC2": entry}
+    cache.write_text(json.dumps({"refreshed": refreshed, "messages": messages}), encoding="utf-8")
+    assert mod._load_message_cache(str(cache)) == ({}, None)
+
+
+def test_message_cache_in_the_old_flat_layout_is_a_miss(tmp_path: Path) -> None:
+    cache = tmp_path / "messages.json"
+    cache.write_text(json.dumps({"MC1": dict.fromkeys(mod.FIELD_ORDER, "")}), encoding="utf-8")
+    assert mod._load_message_cache(str(cache)) == ({}, None)
+
+
+def test_save_token_cache_is_private_and_leaves_no_temp(tmp_path: Path) -> None:
+    class _Cache:
+        has_state_changed = True
+
+        def serialize(self) -> str:
+            return '{"AccessToken": {}}'
+
+    out = tmp_path / "msal_cache.json"
+    mod._save_token_cache(str(out), _Cache())  # type: ignore[arg-type]
+    assert out.read_text(encoding="utf-8") == '{"AccessToken": {}}'
+    assert [p.name for p in tmp_path.iterdir()] == ["msal_cache.json"]
+    if os.name == "posix":
+        assert out.stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("Rolling out 2025 to 123456 tenants. Roadmap ID: 654321", "654321"),
+        ("See feature 123456 and 234567", "123456"),
+        ("No identifiers here", ""),
+    ],
+)
+def test_extract_public_id_prefers_explicit_hint(content: str, expected: str) -> None:
+    assert mod._extract_public_id({"body": {"content": content}}) == expected
@@ -55,3 +55,47 @@ def test_acquire_token_presence_or_skip(monkeypatch: pytest.MonkeyPatch) -> None
     # This will not contact the network; acquire_token returns a fake token string
     tok = graph_client.acquire_token(dict(_FAKE_CFG))
     assert "fake_token_for_" in tok
+
+
+_FIRST_PAGE = "https://graph.microsoft.com/beta/admin/serviceAnnouncement/messages"
+
+
+class _Resp:
+    def __init__(self, payload: dict[str, Any] | None) -> None:
+        # None stands for a failed page
+        self.status_code = 503 if payload is None else 200
+        self.content = json.dumps(payload).encode("utf-8")
+
+
+def _fake_session(pages: dict[str, dict[str, Any] | None]) -> type:
+    class _Session:
+        def __enter__(self) -> _Session:
+            return self
+
+        def __exit__(self, *exc: object) -> None:
+            return None
+
+        def get(self, url: str, **_: Any) -> _Resp:
+            return _Resp(pages[url])
+
+    return _Session
+
+
+def test_fetch_messages_follows_next_link(monkeypatch: pytest.MonkeyPatch) -> None:
+    pages = {
+        _FIRST_PAGE: {"value": [{"id": "MC1"}], "@odata.nextLink": "page2"},
+        "page2": {"value": [{"id": "MC2"}]},
+    }
+    monkeypatch.setattr(graph_client, "_session", _fake_session(pages))
+    client = graph_client.GraphClient(dict(_FAKE_CFG))
+    assert [m["id"] for m in client.fetch_messages()] == ["MC1", "MC2"]
+
+
+def test_fetch_messages_failed_page_returns_nothing(monkeypatch: pytest.MonkeyPatch) -> None:
+    pages = {
+        _FIRST_PAGE: {"value": [{"id": "MC1"}], "@odata.nextLink": "page2"},
+        "page2": None,
+    }
+    monkeypatch.setattr(graph_client, "_session", _fake_session(pages))
+    client = graph_client.GraphClient(dict(_FAKE_CFG))
+    assert client.fetch_messages() == []  # not a silent first-page prefix